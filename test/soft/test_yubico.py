@@ -7,6 +7,7 @@ import struct
 import unittest
 import yubico.yubico_util as yubico_util
 from yubico.yubico_util import crc16
+from yubico.yubikey_defs import MODE, PID
 
 CRC_OK_RESIDUAL=0xf0b8
 
@@ -45,5 +46,21 @@ class TestCRC(unittest.TestCase):
         """ Test modhex decoding """
         self.assertEqual(b"0123456789abcdef", yubico_util.modhex_decode(b"cbdefghijklnrtuv"))
 
+class TestDefs(unittest.TestCase):
+
+    def test_mode_all(self):
+        """ Test filtering of USB modes """
+        self.assertEqual(len(MODE.all()), 7)
+        self.assertEqual(MODE.all(otp=True, ccid=True),
+                         set([MODE.OTP_CCID, MODE.OTP_U2F_CCID]))
+
+    def test_pid_all(self):
+        """ Test filtering of PIDs """
+        self.assertEqual(len(PID.all()), 17)
+        self.assertTrue(PID.YUBIKEY in PID.all(otp=True))
+        self.assertFalse(PID.NEO_CCID in PID.all(otp=True))
+        self.assertEqual(PID.all(otp=True, ccid=True, u2f=True),
+                         set([PID.NEO_OTP_U2F_CCID, PID.YK4_OTP_U2F_CCID]))
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+import unittest
+from yubico.yubikey_defs import MODE
+from yubico.yubikey_neo_usb_hid import YubiKeyNEO_NDEF, YubiKeyNEO_DEVICE_CONFIG
+
+class YubiKeyNEOTests(unittest.TestCase):
+
+    def test_ndef_uri_prefix(self):
+        """ Test NDEF URI identifier code """
+        ndef = YubiKeyNEO_NDEF(b'https://example.com')
+        self.assertEqual(ndef._encode_ndef_uri_type(ndef.ndef_str),
+                         b'\x04example.com')
+
+    def test_ndef_uri_prefix_case(self):
+        """ Test NDEF URI identifier code is case insensitive """
+        ndef = YubiKeyNEO_NDEF(b'HTTP://WWW.Example.com')
+        self.assertEqual(ndef._encode_ndef_uri_type(ndef.ndef_str),
+                         b'\x01Example.com')
+
+    def test_ndef_uri_longest_prefix(self):
+        """ Test NDEF URI identifier code picks the longest prefix """
+        ndef = YubiKeyNEO_NDEF(b'urn:epc:id:foo')
+        self.assertEqual(ndef._encode_ndef_uri_type(ndef.ndef_str),
+                         b'\x1efoo')
+
+    def test_ndef_uri_unknown_prefix(self):
+        """ Test NDEF URI with unknown prefix """
+        ndef = YubiKeyNEO_NDEF(b'foo://bar')
+        self.assertEqual(ndef._encode_ndef_uri_type(ndef.ndef_str),
+                         b'\x00foo://bar')
+
+    def test_ndef_uri_empty(self):
+        """ Test NDEF URI with empty payload """
+        ndef = YubiKeyNEO_NDEF(b'')
+        self.assertEqual(ndef._encode_ndef_uri_type(ndef.ndef_str), b'\x00')
+
+    def test_ndef_default_access_code(self):
+        """ Test NDEF default access code is all zeros """
+        ndef = YubiKeyNEO_NDEF(b'')
+        self.assertEqual(ndef.access_code, b'\x00' * 6)
+        self.assertTrue(ndef.to_string().endswith(b'\x00' * 6))
+
+    def test_ndef_to_frame(self):
+        """ Test NDEF frame payload """
+        frame = YubiKeyNEO_NDEF(b'https://example.com').to_frame()
+        self.assertEqual(len(frame.payload), 64)
+        self.assertTrue(frame.payload.startswith(b'\x0c\x55\x04example.com\x00'))
+
+    def test_device_config_to_frame(self):
+        """ Test DEVICE_CONFIG frame payload """
+        config = YubiKeyNEO_DEVICE_CONFIG(MODE.OTP_CCID).cr_timeout(15)
+        self.assertEqual(config.to_frame().payload,
+                         b'\x02\x0f\x00\x00' + b'\x00' * 60)
+
+if __name__ == '__main__':
+    unittest.main()
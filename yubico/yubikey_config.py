@@ -29,14 +29,14 @@ from .yubikey_config_util import YubiKeyConfigBits, YubiKeyConfigFlag, YubiKeyEx
 from .yubikey_defs import SLOT
 
 
+_COMMAND_NAMES = dict((getattr(SLOT, attr), 'SLOT_%s' % attr)
+                      for attr in SLOT.__dict__.keys()
+                      if not attr.startswith('_') and attr == attr.upper())
+
+
 def command2str(num):
     """ Turn command number into name """
-    for attr in SLOT.__dict__.keys():
-        if not attr.startswith('_') and attr == attr.upper():
-            if getattr(SLOT, attr) == num:
-                return 'SLOT_%s' % attr
-
-    return "0x%02x" % (num)
+    return _COMMAND_NAMES.get(num, "0x%02x" % (num))
 
 ### BEGIN DEPRECATED
 ### These are here for backwards compatibility, DO NOT USE!
@@ -76,41 +76,55 @@ class MODE(object):
 
     @classmethod
     def all(cls, otp=False, ccid=False, u2f=False):
-        """Returns a set of all USB modes, with optional filtering"""
-        modes = set([
-            cls.OTP,
-            cls.CCID,
-            cls.OTP_CCID,
-            cls.U2F,
-            cls.OTP_U2F,
-            cls.U2F_CCID,
-            cls.OTP_U2F_CCID
-        ])
+        """Returns a frozenset of all USB modes, with optional filtering"""
+        return _MODE_CACHE[(bool(otp), bool(ccid), bool(u2f))]
 
+    @classmethod
+    def _filter(cls, otp, ccid, u2f):
+        modes = cls._ALL
         if otp:
-            modes.difference_update(set([
-                cls.CCID,
-                cls.U2F,
-                cls.U2F_CCID
-            ]))
-
+            modes = modes - cls._OTP_EXCLUDE
         if ccid:
-            modes.difference_update(set([
-                cls.OTP,
-                cls.U2F,
-                cls.OTP_U2F
-            ]))
-
+            modes = modes - cls._CCID_EXCLUDE
         if u2f:
-            modes.difference_update(set([
-                cls.OTP,
-                cls.CCID,
-                cls.OTP_CCID
-            ]))
-
+            modes = modes - cls._U2F_EXCLUDE
         return modes
 
 
+MODE._ALL = frozenset([
+    MODE.OTP,
+    MODE.CCID,
+    MODE.OTP_CCID,
+    MODE.U2F,
+    MODE.OTP_U2F,
+    MODE.U2F_CCID,
+    MODE.OTP_U2F_CCID
+])
+MODE._OTP_EXCLUDE = frozenset([
+    MODE.CCID,
+    MODE.U2F,
+    MODE.U2F_CCID
+])
+MODE._CCID_EXCLUDE = frozenset([
+    MODE.OTP,
+    MODE.U2F,
+    MODE.OTP_U2F
+])
+MODE._U2F_EXCLUDE = frozenset([
+    MODE.OTP,
+    MODE.CCID,
+    MODE.OTP_CCID
+])
+
+_FILTERS = [(otp, ccid, u2f)
+            for otp in (False, True)
+            for ccid in (False, True)
+            for u2f in (False, True)]
+
+# There are only eight possible filter combinations, compute them once
+_MODE_CACHE = dict((f, MODE._filter(*f)) for f in _FILTERS)
+
+
 YUBICO_VID               = 0x1050  # Global vendor ID
 
 
@@ -140,65 +154,73 @@ class PID(object):
 
     @classmethod
     def all(cls, otp=False, ccid=False, u2f=False):
-        """Returns a set of all PIDs, with optional filtering"""
-        pids = set([
-            cls.YUBIKEY,
-            cls.NEO_OTP,
-            cls.NEO_OTP_CCID,
-            cls.NEO_CCID,
-            cls.NEO_U2F,
-            cls.NEO_OTP_U2F,
-            cls.NEO_U2F_CCID,
-            cls.NEO_OTP_U2F_CCID,
-            cls.NEO_SKY,
-            cls.YK4_OTP,
-            cls.YK4_U2F,
-            cls.YK4_OTP_U2F,
-            cls.YK4_CCID,
-            cls.YK4_OTP_CCID,
-            cls.YK4_U2F_CCID,
-            cls.YK4_OTP_U2F_CCID,
-            cls.PLUS_U2F_OTP
-        ])
+        """Returns a frozenset of all PIDs, with optional filtering"""
+        return _PID_CACHE[(bool(otp), bool(ccid), bool(u2f))]
 
+    @classmethod
+    def _filter(cls, otp, ccid, u2f):
+        pids = cls._ALL
         if otp:
-            pids.difference_update(set([
-                cls.NEO_CCID,
-                cls.NEO_U2F,
-                cls.NEO_U2F_CCID,
-                cls.NEO_SKY,
-                cls.YK4_U2F,
-                cls.YK4_CCID,
-                cls.YK4_U2F_CCID
-            ]))
-
+            pids = pids - cls._OTP_EXCLUDE
         if ccid:
-            pids.difference_update(set([
-                cls.YUBIKEY,
-                cls.NEO_OTP,
-                cls.NEO_U2F,
-                cls.NEO_OTP_U2F,
-                cls.NEO_SKY,
-                cls.YK4_OTP,
-                cls.YK4_U2F,
-                cls.YK4_OTP_U2F,
-                cls.PLUS_U2F_OTP
-            ]))
-
+            pids = pids - cls._CCID_EXCLUDE
         if u2f:
-            pids.difference_update(set([
-                cls.YUBIKEY,
-                cls.NEO_OTP,
-                cls.NEO_OTP_CCID,
-                cls.NEO_CCID,
-                cls.YK4_OTP,
-                cls.YK4_CCID,
-                cls.YK4_OTP_CCID
-            ]))
-
+            pids = pids - cls._U2F_EXCLUDE
         return pids
 
 
+PID._ALL = frozenset([
+    PID.YUBIKEY,
+    PID.NEO_OTP,
+    PID.NEO_OTP_CCID,
+    PID.NEO_CCID,
+    PID.NEO_U2F,
+    PID.NEO_OTP_U2F,
+    PID.NEO_U2F_CCID,
+    PID.NEO_OTP_U2F_CCID,
+    PID.NEO_SKY,
+    PID.YK4_OTP,
+    PID.YK4_U2F,
+    PID.YK4_OTP_U2F,
+    PID.YK4_CCID,
+    PID.YK4_OTP_CCID,
+    PID.YK4_U2F_CCID,
+    PID.YK4_OTP_U2F_CCID,
+    PID.PLUS_U2F_OTP
+])
+PID._OTP_EXCLUDE = frozenset([
+    PID.NEO_CCID,
+    PID.NEO_U2F,
+    PID.NEO_U2F_CCID,
+    PID.NEO_SKY,
+    PID.YK4_U2F,
+    PID.YK4_CCID,
+    PID.YK4_U2F_CCID
+])
+PID._CCID_EXCLUDE = frozenset([
+    PID.YUBIKEY,
+    PID.NEO_OTP,
+    PID.NEO_U2F,
+    PID.NEO_OTP_U2F,
+    PID.NEO_SKY,
+    PID.YK4_OTP,
+    PID.YK4_U2F,
+    PID.YK4_OTP_U2F,
+    PID.PLUS_U2F_OTP
+])
+PID._U2F_EXCLUDE = frozenset([
+    PID.YUBIKEY,
+    PID.NEO_OTP,
+    PID.NEO_OTP_CCID,
+    PID.NEO_CCID,
+    PID.YK4_OTP,
+    PID.YK4_CCID,
+    PID.YK4_OTP_CCID
+])
+
+_PID_CACHE = dict((f, PID._filter(*f)) for f in _FILTERS)
+
+
 class YK4_CAPA(object):
     """Capability bits in the YK4_CAPA field"""
     OTP                  = 0x01  # OTP functionality
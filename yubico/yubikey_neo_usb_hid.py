@@ -29,6 +29,20 @@ from . import yubico_util
 _ACC_CODE_SIZE		= 6     # Size of access code to re-program device
 _NDEF_DATA_SIZE		= 54
 
+# typedef struct {
+#   unsigned char len;                  // Payload length
+#   unsigned char type;                 // NDEF type specifier
+#   unsigned char data[NDEF_DATA_SIZE]; // Payload size
+#   unsigned char curAccCode[ACC_CODE_SIZE]; // Access code
+# } YKNDEF;
+_NDEF_STRUCT		= struct.Struct('< B B %ss %ss' % (_NDEF_DATA_SIZE, _ACC_CODE_SIZE))
+_DEVICE_CONFIG_STRUCT	= struct.Struct('<BBH')
+
+_ZERO_ACC_CODE		= b'\x00' * _ACC_CODE_SIZE
+# Zero padding of the packed structs up to the 64 byte frame payload
+_NDEF_FRAME_TAIL	= b'\x00' * (64 - _NDEF_STRUCT.size)
+_DEVICE_CONFIG_FRAME_TAIL = b'\x00' * (64 - _DEVICE_CONFIG_STRUCT.size)
+
 # from nfcdef.h
 _NDEF_URI_TYPE		= ord('U')
 _NDEF_TEXT_TYPE		= ord('T')
@@ -72,6 +86,20 @@ uri_identifiers = [
     (0x23, "urn:nfc:",),
     ]
 
+# Lower case bytes prefixes and their codes as parallel tuples, longest
+# prefix first so that the longest match wins
+_URI_CODES, _URI_PREFIXES = zip(*sorted(
+    ((code, prefix.encode('ascii').lower())
+     for (code, prefix) in uri_identifiers),
+    key=lambda x: -len(x[1])))
+
+# The same prefixes grouped by their first byte, so that only the few
+# sharing the first byte of the payload have to be compared
+_URI_BY_FIRST = {}
+for (_code, _prefix) in zip(_URI_CODES, _URI_PREFIXES):
+    _URI_BY_FIRST.setdefault(_prefix[:1], []).append((_code, _prefix))
+del _code, _prefix
+
 _NDEF_SLOTS = {
     1: SLOT.NDEF,
     2: SLOT.NDEF2
@@ -175,7 +203,7 @@ class YubiKeyNEO_NDEF(object):
 
     ndef_type = _NDEF_URI_TYPE
     ndef_str = None
-    access_code = yubico_util.chr_byte(0x0) * _ACC_CODE_SIZE
+    access_code = _ZERO_ACC_CODE
     # For _NDEF_URI_TYPE
     ndef_uri_rt = 0x0  # No prepending
     # For _NDEF_TEXT_TYPE
@@ -224,20 +252,11 @@ class YubiKeyNEO_NDEF(object):
             data = self._encode_ndef_text_params(data)
         if len(data) > _NDEF_DATA_SIZE:
             raise YubiKeyNEO_USBHIDError("NDEF payload too long")
-        # typedef struct {
-        #   unsigned char len;                  // Payload length
-        #   unsigned char type;                 // NDEF type specifier
-        #   unsigned char data[NDEF_DATA_SIZE]; // Payload size
-        #   unsigned char curAccCode[ACC_CODE_SIZE]; // Access code
-        # } YKNDEF;
-        #
-        fmt = '< B B %ss %ss' % (_NDEF_DATA_SIZE, _ACC_CODE_SIZE)
-        first = struct.pack(fmt,
-                            len(data),
-                            self.ndef_type,
-                            data.ljust(_NDEF_DATA_SIZE, b'\0'),
-                            self.access_code,
-                            )
+        first = _NDEF_STRUCT.pack(len(data),
+                                  self.ndef_type,
+                                  data.ljust(_NDEF_DATA_SIZE, b'\0'),
+                                  self.access_code,
+                                  )
         #crc = 0xffff - yubico_util.crc16(first)
         #second = first + struct.pack('<H', crc) + self.unlock_code
         return first
@@ -247,7 +266,7 @@ class YubiKeyNEO_NDEF(object):
         Return the current configuration as a YubiKeyFrame object.
         """
         data = self.to_string()
-        payload = data.ljust(64, b'\0')
+        payload = data + _NDEF_FRAME_TAIL
         return yubikey_frame.YubiKeyFrame(command = slot, payload = payload)
 
     def _encode_ndef_uri_type(self, data):
@@ -258,8 +277,9 @@ class YubiKeyNEO_NDEF(object):
         with a one byte code. If the prefix is not known, 0x00 is used.
         """
         t = 0x0
-        for (code, prefix) in uri_identifiers:
-            if data[:len(prefix)].decode('latin-1').lower() == prefix:
+        lower = data.lower()
+        for (code, prefix) in _URI_BY_FIRST.get(lower[:1], ()):
+            if lower.startswith(prefix):
                 t = code
                 data = data[len(prefix):]
                 break
@@ -308,9 +328,7 @@ class YubiKeyNEO_DEVICE_CONFIG(object):
         """
         Return the current DEVICE_CONFIG as a string (always 4 bytes).
         """
-        fmt = '<BBH'
-        first = struct.pack(
-            fmt,
+        first = _DEVICE_CONFIG_STRUCT.pack(
             self._mode,
             self._cr_timeout,
             self._auto_eject_time
@@ -325,7 +343,7 @@ class YubiKeyNEO_DEVICE_CONFIG(object):
         Return the current configuration as a YubiKeyFrame object.
         """
         data = self.to_string()
-        payload = data.ljust(64, b'\0')
+        payload = data + _DEVICE_CONFIG_FRAME_TAIL
         return yubikey_frame.YubiKeyFrame(command=slot, payload=payload)
 
 